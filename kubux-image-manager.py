@@ -13,13 +13,16 @@
 # limitations under the License.
 
 import traceback
+import functools
+import itertools
+import fnmatch
+import locale
 import shutil
 import hashlib
 import json
 import os
 import re
 import shlex
-import math
 import platform
 import secrets
 import queue
@@ -42,14 +45,14 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QPush
                               QAbstractScrollArea)
 from PySide6.QtGui import (QPixmap, QImage, QPainter, QColor, QFont, QFontMetrics,
                           QTextCursor, QDrag, QTextCharFormat, QIcon, QAction, 
-                          QCursor, QKeySequence, QPalette, QTextBlockFormat, QGuiApplication)
+                          QCursor, QKeySequence, QPalette, QTextBlockFormat, QGuiApplication, QTransform)
 
 # External library imports
 from watchdog.events import FileSystemEventHandler, FileClosedNoWriteEvent, FileOpenedEvent
 from watchdog.observers import Observer
 
 from PIL import Image
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # --- configuration ---
@@ -59,8 +62,11 @@ SUPPORTED_IMAGE_EXTENSIONS = (
     '.ico', '.icns', '.avif', '.dds', '.msp', '.pcx', '.ppm',
     '.pbm', '.pgm', '.sgi', '.tga', '.xbm', '.xpm'
 )
+IMAGE_EXTENSION_SET = frozenset(SUPPORTED_IMAGE_EXTENSIONS)
 
-CACHE_SIZE = 1000
+PIL_CACHE_BYTES = 512 * 1024 * 1024
+QT_CACHE_BYTES = 128 * 1024 * 1024
+VIEWER_PIXMAP_CACHE_BYTES = 128 * 1024 * 1024  # per viewer window
 
 HOME_DIR = os.path.expanduser('~')
 CONFIG_DIR = os.path.join(HOME_DIR, ".config", "kubux-image-manager")
@@ -72,13 +78,6 @@ VIEWER_MIN_FRACTION = 0.125
 VIEWER_MAX_FRACTION = 0.50
 APP_SETTINGS_FILE = os.path.join(CONFIG_DIR, "app_settings.json")    
 
-IMAGE_TRANSFORM = [
-    None,                       # 0: identity
-    Image.ROTATE_90,            # 1
-    Image.ROTATE_180,           # 2
-    Image.ROTATE_270            # 3
-]
-
 os.makedirs(THUMBNAIL_CACHE_ROOT, exist_ok=True)
 os.makedirs(CONFIG_DIR, exist_ok=True)
 
@@ -102,7 +101,9 @@ def log_debug(msg):
 
 def get_gtk_ui_font():
     try:
-        subprocess.run(["which", "gsettings"], check=True, capture_output=True)
+        if shutil.which("gsettings") is None:
+            log_error("gsettings command not found or failed.")
+            return "Sans", 10
         font_info_str = subprocess.run(
             ["gsettings", "get", "org.gnome.desktop.interface", "font-name"],
             capture_output=True, text=True, check=True
@@ -133,7 +134,9 @@ def get_gtk_ui_font():
 
 def get_kde_ui_font():
     try:
-        subprocess.run(["which", "kreadconfig5"], check=True, capture_output=True)
+        if shutil.which("kreadconfig5") is None:
+            log_error("kreadconfig5 command not found or failed.")
+            return "Sans", 10
         font_string = subprocess.run(
             ["kreadconfig5", "--file", "kdeglobals", "--group", "General", "--key", "font", 
              "--default", "Sans,10,-1,5,50,0,0,0,0,0"],
@@ -154,6 +157,7 @@ def get_kde_ui_font():
         log_error(f"An error occurred while getting KDE font settings: {e}")
         return "Sans", 10
 
+@functools.lru_cache(maxsize=1)
 def get_linux_system_ui_font_info():
     desktop_session = os.environ.get("XDG_CURRENT_DESKTOP")
     if not desktop_session:
@@ -186,70 +190,102 @@ def copy_truish(the_list):
      return [entry for entry in the_list if entry]
 
 def remove_falsy(the_list):
-    new_list = copy_truish(the_list)
-    the_list.clear()
-    the_list.extend(new_list)
+    the_list[:] = copy_truish(the_list)
 
 def copy_uniq(the_list):
-    helper = set()
-    result = []
-    for entry in the_list:
-        if not entry in helper:
-            helper.add(entry)
-            result.append(entry)
-    return result
+    return list(dict.fromkeys(the_list))
 
 def make_uniq(the_list):
-    new_list = copy_uniq(the_list)
-    the_list.clear()
-    the_list.extend(new_list)
+    the_list[:] = dict.fromkeys(the_list)
 
 def prepend_or_move_to_front(entry, the_list):
-    the_list.insert(0, entry)
-    make_uniq(the_list)
-    remove_falsy(the_list)
+    the_list[:] = [item for item in dict.fromkeys([entry, *the_list]) if item]
     
         
 # --- file ops ---
 
-def is_file_below_dir(file_path, dir_path):
-    file_dir_path = os.path.realpath(os.path.dirname(file_path))
-    dir_path = os.path.realpath(dir_path)
-    if dir_path == file_dir_path:
+def is_real_dir_below(real_path, real_dir_path):
+    if real_dir_path == real_path:
         return True
-    return os.path.commonpath([dir_path, file_dir_path]) == dir_path
+    return os.path.commonpath([real_dir_path, real_path]) == real_dir_path
 
 def is_file_in_dir(file_path, dir_path):
     file_dir_path = os.path.realpath(os.path.dirname(file_path))
     dir_path = os.path.realpath(dir_path)
     return dir_path == file_dir_path
+
+def make_is_file_in_dir(dir_path):
+    """is_file_in_dir for many files: dir_path and each distinct parent are resolved only once."""
+    real_dir_path = os.path.realpath(dir_path)
+    real_parents = {}
+    def is_in_dir(file_path):
+        parent = os.path.dirname(file_path)
+        real_parent = real_parents.get(parent)
+        if real_parent is None:
+            real_parent = real_parents[parent] = os.path.realpath(parent)
+        return real_parent == real_dir_path
+    return is_in_dir
     
 def execute_shell_command(command):
     result = subprocess.run(command, shell=True)
     return result
 
-def execute_shell_command_with_capture(command):
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    return result
+def iterate_shell_output_lines(command, cwd=None):
+    with subprocess.Popen(command, cwd=cwd, shell=True, stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL, text=True) as process:
+        for line in process.stdout:
+            yield line.rstrip('\n')
 
 def filter_for_files_in_directory(command, directory):
-    result = subprocess.run(command, cwd=directory, shell=True, capture_output=True, text=True)
-    line_list = result.stdout.splitlines()
-    return [file for file in line_list if (os.path.isfile(os.path.join(directory, file)) and is_file_in_dir(file, directory))]
+    return [file for file in iterate_shell_output_lines(command, cwd=directory)
+            if (os.path.isfile(os.path.join(directory, file)) and is_file_in_dir(file, directory))]
         
 def filter_for_files(command):
-    line_list = execute_shell_command_with_capture(command).stdout.splitlines()
-    return [file for file in line_list if os.path.isfile(file)]
+    return [file for file in iterate_shell_output_lines(command) if os.path.isfile(file)]
+
+SIMPLE_GLOB_PATTERN = re.compile(r'[\w.*?+-]+')
+
+def scan_image_files_for_command(dir, cmd):
+    """
+    Answer the common list commands ("ls", "ls *.jpg", "find . -maxdepth 1 -type f")
+    with os.scandir instead of a shell. Returns None for anything else.
+    """
+    words = cmd.split()
+    if words == ["find", ".", "-maxdepth", "1", "-type", "f"]:
+        # find reports entries in directory order and does not follow symlinks
+        with os.scandir(dir) as entries:
+            return [os.path.normpath(entry.path) for entry in entries
+                    if entry.is_file(follow_symlinks=False) and is_image_file_name(entry.name)]
+    if words[:1] != ["ls"] or len(words) > 2:
+        return None
+    pattern = words[1] if len(words) == 2 else "*"
+    if not SIMPLE_GLOB_PATTERN.fullmatch(pattern) or pattern.startswith(('-', '.')):
+        return None
+    with os.scandir(dir) as entries:
+        matches = [entry for entry in entries
+                   if not entry.name.startswith('.') and fnmatch.fnmatchcase(entry.name, pattern)]
+    # ls sorts by the collation order of the locale, which Qt has already set up
+    matches.sort(key=lambda entry: locale.strxfrm(entry.name))
+    return [os.path.normpath(entry.path) for entry in matches if is_image_direntry(entry)]
 
 def list_image_files_by_command(dir, cmd):
-    raw_output = subprocess.run(cmd, cwd=dir, shell=True, capture_output=True, text=True).stdout.splitlines()
+    listing = scan_image_files_for_command(dir, cmd)
+    if listing is not None:
+        return listing
+    real_dir = os.path.realpath(dir)
+    real_parents = {}  # results typically share a handful of parent directories
     listing = []
-    for path in raw_output:
-        if os.path.isabs(path):
-            listing.append(os.path.normpath(path))
-        else:
-            listing.append(os.path.normpath(os.path.join(dir, path)))
-    return [path for path in listing if is_image_file(path) and is_file_below_dir(path, dir)]
+    for path in iterate_shell_output_lines(cmd, cwd=dir):
+        path = os.path.normpath(os.path.join(dir, path))
+        if not is_image_file(path):
+            continue
+        parent = os.path.dirname(path)
+        real_parent = real_parents.get(parent)
+        if real_parent is None:
+            real_parent = real_parents[parent] = os.path.realpath(parent)
+        if is_real_dir_below(real_parent, real_dir):
+            listing.append(path)
+    return listing
     
 def move_file_to_directory(file_path, target_dir_path):
     try:
@@ -345,9 +381,10 @@ class DirectoryEventHandler(QObject, FileSystemEventHandler):
         log_debug(f"Initializing event handler for {directory} with picker {image_picker}")
         self.image_picker = image_picker
         self.directory = directory
-        # Connect signal to the broadcast method - this connection ensures the slot
-        # runs on the main thread since image_picker.master lives there
-        self.directory_changed.connect(self.image_picker.master.broadcast_contents_change)
+        self.change_pending = False  # a directory_changed emission is still queued for the main thread
+        # Connect signal to the handler's own slot - this connection ensures the slot
+        # runs on the main thread since the handler was created there
+        self.directory_changed.connect(self._on_directory_changed)
         
     def on_any_event(self, event):
         # Emit signal - this is thread-safe and will invoke the connected slot
@@ -356,7 +393,14 @@ class DirectoryEventHandler(QObject, FileSystemEventHandler):
             return       
         if get_watch_for_changes():
             log_debug(f"directory {self.directory} has changed: {event}")
-            self.directory_changed.emit()
+            # A bulk copy fires hundreds of events; one queued emission covers them all.
+            if not self.change_pending:
+                self.change_pending = True
+                self.directory_changed.emit()
+
+    def _on_directory_changed(self):
+        self.change_pending = False
+        self.image_picker.master.broadcast_contents_change()
 
 
 class DirectoryWatcher():
@@ -427,109 +471,287 @@ def resize_image(image, target_width, target_height):
     new_width, new_height = calculate_thumbnail_dimensions(original_width, original_height, target_width, target_height)
     if new_width == original_width and new_height == original_height:
         return image.copy()
-    return image.resize((new_width, new_height), resample=Image.LANCZOS)
+    # Images that are not decoded yet (e.g. fresh from Image.open) let libjpeg
+    # scale down in the DCT domain; for already loaded images this is a no-op.
+    image.draft(image.mode, (2 * new_width, 2 * new_height))
+    # reducing_gap lets Pillow box-reduce by an integer factor first and run
+    # LANCZOS only over the last (at least 2x) step.
+    return image.resize((new_width, new_height), resample=Image.LANCZOS, reducing_gap=2.0)
 
 def get_thumbnail_dimensions(img_path, max_size):
     """Quickly read image dimensions and calculate thumbnail size without loading full image."""
     try:
-        with Image.open(img_path) as img:
-            orig_w, orig_h = img.size
+        orig_w, orig_h = get_image_size(img_path)
         # Use the same calculation logic as resize_image to ensure consistency
         return calculate_thumbnail_dimensions(orig_w, orig_h, max_size, max_size)
     except Exception as e:
         log_error(f"Error reading dimensions for {img_path}: {e}")
         return max_size, max_size  # fallback to square
 
+CACHE_LOCK = threading.Lock()
+
+FILE_ID_CACHE = OrderedDict()  # (img_path, width) -> (stat signature, file id)
+FILE_ID_CACHE_SIZE = 8192
+
+IMAGE_SIZE_CACHE = OrderedDict()  # (st_dev, st_ino, st_mtime) -> (width, height)
+IMAGE_SIZE_CACHE_SIZE = 8192
+
+def get_image_size(img_path):
+    """Pixel size from the image header; memoized per file version, so a hit costs one stat."""
+    stat_result = os.stat(img_path)
+    signature = (stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime)
+    with CACHE_LOCK:
+        size = IMAGE_SIZE_CACHE.get(signature)
+        if size is not None:
+            IMAGE_SIZE_CACHE.move_to_end(signature)
+            return size
+    with Image.open(img_path) as img:
+        size = img.size
+    with CACHE_LOCK:
+        IMAGE_SIZE_CACHE[signature] = size
+        if len(IMAGE_SIZE_CACHE) > IMAGE_SIZE_CACHE_SIZE:
+            IMAGE_SIZE_CACHE.popitem(last=False)
+    return size
+
+def make_file_id(real_path, width, mtime):
+    key = f"{real_path}_{width}_{mtime}"
+    # The id only has to be a unique, filesystem-safe name; 128 bits of BLAKE2 suffice.
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
 def uniq_file_id(img_path, width=-1):
+    # One stat per call; realpath and hashing are only redone when the file changed.
     try:
-        real_path = os.path.realpath(img_path)
-        mtime = os.path.getmtime(real_path)
+        stat_result = os.stat(img_path)
     except FileNotFoundError:
         log_error(f"Error: Original image file not found: {img_path}")
         return None
     except Exception as e:
         log_error(f"Warning: Could not get modification time for {img_path}: {e}")
-        mtime = 0
-    key = f"{real_path}_{width}_{mtime}"
-    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return make_file_id(os.path.realpath(img_path), width, 0)
+    lookup = (img_path, width)
+    signature = (stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime)
+    with CACHE_LOCK:
+        cached = FILE_ID_CACHE.get(lookup)
+        if cached is not None and cached[0] == signature:
+            FILE_ID_CACHE.move_to_end(lookup)
+            return cached[1]
+    file_id = make_file_id(os.path.realpath(img_path), width, stat_result.st_mtime)
+    with CACHE_LOCK:
+        FILE_ID_CACHE[lookup] = (signature, file_id)
+        if len(FILE_ID_CACHE) > FILE_ID_CACHE_SIZE:
+            FILE_ID_CACHE.popitem(last=False)
+    return file_id
 
-CACHE_LOCK = threading.Lock()
+class ByteBudgetCache:
+    """Cache bounded by the total byte size of its entries rather than their number.
 
-PIL_CACHE = OrderedDict()
-QT_CACHE = OrderedDict()
+    Eviction is LRU-ordered, but among the oldest EVICTION_WINDOW entries the one
+    that is cheapest to rebuild per byte (weighted by recent hits) goes first, so
+    slow-to-decode images outlive quick ones. Not locked itself; callers hold CACHE_LOCK.
+    """
+
+    EVICTION_WINDOW = 8
+    HIGH_WATER = 0.9  # fraction of max_bytes above which has_room() turns prefetching away
+
+    def __init__(self, max_bytes, size_of):
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.total_bytes = 0
+        self._entries = OrderedDict()  # key -> [value, size in bytes, rebuild cost in seconds, hits]
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def has_room(self):
+        return self.total_bytes < self.HIGH_WATER * self.max_bytes
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        entry[3] += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, cost=0.0):
+        size = self.size_of(value)
+        old_entry = self._entries.pop(key, None)
+        if old_entry is not None:
+            self.total_bytes -= old_entry[1]
+        self._entries[key] = [value, size, cost, 0]
+        self.total_bytes += size
+        # Always keep the newest entry, even if it alone exceeds the budget.
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            self._evict_one(key)
+
+    def put_if_room(self, key, value, cost=0.0):
+        """Insert only if the entry fits without evicting anything; returns whether it was stored."""
+        if key in self._entries:
+            return False
+        size = self.size_of(value)
+        if self.total_bytes + size > self.max_bytes:
+            return False
+        self._entries[key] = [value, size, cost, 0]
+        self.total_bytes += size
+        return True
+
+    def _evict_one(self, newest_key):
+        candidates = [item for item in itertools.islice(self._entries.items(), self.EVICTION_WINDOW)
+                      if item[0] != newest_key]
+        victim_key, victim = min(candidates,
+                                 key=lambda item: (item[1][3] + 1) * item[1][2] / max(item[1][1], 1))
+        # Age the survivors so entries that stop being used are eventually evicted.
+        for _, entry in candidates:
+            entry[3] >>= 1
+        del self._entries[victim_key]
+        self.total_bytes -= victim[1]
+
+def pil_image_bytes(image):
+    return image.width * image.height * len(image.getbands())
+
+def qpixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+PIL_CACHE = ByteBudgetCache(PIL_CACHE_BYTES, pil_image_bytes)
+QT_CACHE = ByteBudgetCache(QT_CACHE_BYTES, qpixmap_bytes)
 
 def get_full_size_image(img_path):
     cache_key = uniq_file_id(img_path)
     with CACHE_LOCK:
-        if cache_key in PIL_CACHE:
-            PIL_CACHE.move_to_end(cache_key)
-            return PIL_CACHE[cache_key]
+        full_image = PIL_CACHE.get(cache_key)
+    if full_image is not None:
+        return full_image
     try:
+        start_time = time.perf_counter()
         full_image = Image.open(img_path)
         full_image.load()
         with CACHE_LOCK:
-            PIL_CACHE[cache_key] = full_image
-            if len(PIL_CACHE) > CACHE_SIZE:
-                PIL_CACHE.popitem(last=False)
+            PIL_CACHE.put(cache_key, full_image, time.perf_counter() - start_time)
         return full_image
     except Exception as e:
         log_error(f"Error loading image for {img_path}: {e}")
         return None
         
+KNOWN_THUMBNAILS = {}  # thumbnail size -> set of file names present in its cache subdirectory
+
+def thumbnail_cache_dir(thumbnail_max_size):
+    """Return the cache subdirectory for a thumbnail size and the set of thumbnails known to exist there.
+
+    The directory is created and scanned once per size; afterwards existence checks are set lookups.
+    """
+    thumbnail_cache_subdir = os.path.join(THUMBNAIL_CACHE_ROOT, str(thumbnail_max_size))
+    with CACHE_LOCK:
+        known_thumbnails = KNOWN_THUMBNAILS.get(thumbnail_max_size)
+    if known_thumbnails is None:
+        os.makedirs(thumbnail_cache_subdir, exist_ok=True)
+        with os.scandir(thumbnail_cache_subdir) as entries:
+            names = {entry.name for entry in entries if not entry.name.startswith("tmp-")}
+        with CACHE_LOCK:
+            known_thumbnails = KNOWN_THUMBNAILS.setdefault(thumbnail_max_size, names)
+    return thumbnail_cache_subdir, known_thumbnails
+
 def get_or_make_pil_by_key(cache_key, img_path, thumbnail_max_size):
     if cache_key is None:
         return None
-    thumbnail_size_str = str(thumbnail_max_size)
-    thumbnail_cache_subdir = os.path.join(THUMBNAIL_CACHE_ROOT, thumbnail_size_str)
-    os.makedirs(thumbnail_cache_subdir, exist_ok=True)
-    cached_thumbnail_path = os.path.join(thumbnail_cache_subdir, f"{cache_key}.png")
+    thumbnail_cache_subdir, known_thumbnails = thumbnail_cache_dir(thumbnail_max_size)
+    thumbnail_name = f"{cache_key}.png"
+    cached_thumbnail_path = os.path.join(thumbnail_cache_subdir, thumbnail_name)
     pil_image_thumbnail = None
-    if os.path.exists(cached_thumbnail_path):
+    if thumbnail_name in known_thumbnails:
         try:
             pil_image_thumbnail = Image.open(cached_thumbnail_path)
         except Exception as e:
             log_error(f"Error loading thumbnail for {img_path}: {e}")
+            known_thumbnails.discard(thumbnail_name)
     if pil_image_thumbnail is None:
         try:
-            pil_image_thumbnail = resize_image(get_full_size_image(img_path), thumbnail_max_size, thumbnail_max_size)
-            tmp_path = os.path.join(os.path.dirname(cached_thumbnail_path), "tmp-" + os.path.basename(cached_thumbnail_path))
-            pil_image_thumbnail.save(tmp_path)
+            # Open the source lazily (not via get_full_size_image) so resize_image can
+            # use the draft fast path and the full-size image does not enter PIL_CACHE.
+            with Image.open(img_path) as source_image:
+                pil_image_thumbnail = resize_image(source_image, thumbnail_max_size, thumbnail_max_size)
+            # Store the thumbnail in a mode pil_to_qimage takes as is, so the
+            # conversion happens once here and not on every load from disk.
+            if pil_image_thumbnail.mode not in ("RGB", "RGBA"):
+                pil_image_thumbnail = pil_image_thumbnail.convert("RGBA")
+            # Thumbnails may be generated concurrently, so the temporary file is per thread.
+            tmp_path = os.path.join(os.path.dirname(cached_thumbnail_path),
+                                    f"tmp-{threading.get_ident()}-" + os.path.basename(cached_thumbnail_path))
+            # Generating is expensive anyway; re-creating the directory here copes with a wiped cache.
+            os.makedirs(thumbnail_cache_subdir, exist_ok=True)
+            # zlib level 3 encodes several times faster than the default 6 for files
+            # about a tenth larger; decoding speed is the same.
+            pil_image_thumbnail.save(tmp_path, format="PNG", compress_level=3)
             os.replace(tmp_path, cached_thumbnail_path)
+            known_thumbnails.add(thumbnail_name)
         except Exception as e:
             log_error(f"Error creating thumbnail for {img_path}: {e}")
     return pil_image_thumbnail
 
-def get_or_make_pil(img_path, thumbnail_max_size):
+def get_or_make_qimage_by_key(cache_key, img_path, thumbnail_max_size):
+    """Thumbnail as a QImage; a thumbnail already on disk is decoded by Qt without a trip through PIL."""
+    thumbnail_cache_subdir, known_thumbnails = thumbnail_cache_dir(thumbnail_max_size)
+    thumbnail_name = f"{cache_key}.png"
+    if thumbnail_name in known_thumbnails:
+        qimage = QImage(os.path.join(thumbnail_cache_subdir, thumbnail_name))
+        if not qimage.isNull():
+            return qimage.convertToFormat(QImage.Format_ARGB32_Premultiplied if qimage.hasAlphaChannel()
+                                          else QImage.Format_RGB32)
+    # Missing or unreadable: the PIL path (re)generates it.
+    return pil_to_qimage(get_or_make_pil_by_key(cache_key, img_path, thumbnail_max_size))
+
+def prefetch_thumbnail(img_path, thumbnail_max_size):
+    """Make sure the disk thumbnail exists and, while QT_CACHE is below its high-water mark, decode it.
+
+    Runs on worker threads. Returns (cache_key, QImage, seconds it took) for the GUI
+    thread to upload with put_if_room, or None; above the mark nothing is decoded on a disk hit.
+    """
     cache_key = uniq_file_id(img_path, thumbnail_max_size)
-    return get_or_make_pil_by_key(cache_key, img_path, thumbnail_max_size)
+    if cache_key is None:
+        return None
+    with CACHE_LOCK:
+        wanted = QT_CACHE.has_room() and cache_key not in QT_CACHE
+    try:
+        if not wanted:
+            _, known_thumbnails = thumbnail_cache_dir(thumbnail_max_size)
+            if f"{cache_key}.png" not in known_thumbnails:
+                get_or_make_pil_by_key(cache_key, img_path, thumbnail_max_size)
+            return None
+        start_time = time.perf_counter()
+        qimage = get_or_make_qimage_by_key(cache_key, img_path, thumbnail_max_size)
+        return cache_key, qimage, time.perf_counter() - start_time
+    except Exception as e:
+        log_error(f"Error prefetching thumbnail for {img_path}: {e}")
+        return None
 
-def pil_to_qpixmap(pil_image):
+def pil_to_qimage(pil_image):
+    """Convert to a QImage that owns its pixels in a format QPixmap takes without conversion."""
     if pil_image is None:
-        return QPixmap()
+        return QImage()
     # Convert all non-RGB/RGBA modes to RGBA for consistent handling
     if pil_image.mode not in ("RGB", "RGBA"):
         pil_image = pil_image.convert("RGBA")
     if pil_image.mode == "RGB":
         data = pil_image.tobytes("raw", "RGB")
         qimage = QImage(data, pil_image.width, pil_image.height, 3 * pil_image.width, QImage.Format_RGB888)
-    else:
-        data = pil_image.tobytes("raw", "RGBA")
-        qimage = QImage(data, pil_image.width, pil_image.height, 4 * pil_image.width, QImage.Format_RGBA8888)
-    return QPixmap.fromImage(qimage.copy())
+        return qimage.convertToFormat(QImage.Format_RGB32)
+    data = pil_image.tobytes("raw", "RGBA")
+    qimage = QImage(data, pil_image.width, pil_image.height, 4 * pil_image.width, QImage.Format_RGBA8888)
+    return qimage.convertToFormat(QImage.Format_ARGB32_Premultiplied)
 
 def get_or_make_qt_by_key(cache_key, img_path, thumbnail_max_size):
     if cache_key is None:
         return QPixmap()
     with CACHE_LOCK:
-        if cache_key in QT_CACHE:
-            QT_CACHE.move_to_end(cache_key)
-            return QT_CACHE[cache_key]
-    pil_image = get_or_make_pil_by_key(cache_key, img_path, thumbnail_max_size)
-    qt_pixmap = pil_to_qpixmap(pil_image)
+        qt_pixmap = QT_CACHE.get(cache_key)
+    if qt_pixmap is not None:
+        return qt_pixmap
+    start_time = time.perf_counter()
+    qt_pixmap = QPixmap.fromImage(get_or_make_qimage_by_key(cache_key, img_path, thumbnail_max_size))
     with CACHE_LOCK:
-        QT_CACHE[cache_key] = qt_pixmap
-        if len(QT_CACHE) > CACHE_SIZE:
-            QT_CACHE.popitem(last=False)
+        QT_CACHE.put(cache_key, qt_pixmap, time.perf_counter() - start_time)
     return qt_pixmap
      
 def get_or_make_qt(img_path, thumbnail_max_size):
@@ -539,32 +761,42 @@ def get_or_make_qt(img_path, thumbnail_max_size):
 
 class ThumbnailLoader(QObject):
     """Asynchronously loads thumbnails using a thread pool."""
-    thumbnail_ready = Signal(str, QPixmap)  # (cache_key, pixmap)
+    thumbnail_ready = Signal(str, QImage, float)  # (cache_key, image, seconds it took)
     
     def __init__(self, max_workers=4):
         super().__init__()
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.thumbnail_ready.connect(self._update_button, Qt.QueuedConnection)
-        self.buttons = {}  # cache_key -> button
+        self.buttons = {}  # cache_key -> button, for loads still in flight
     
     def _load_async(self, cache_key, img_path, width, button):
         """Queue thumbnail generation for background processing."""
+        already_queued = cache_key in self.buttons
         self.buttons[cache_key] = button
-        self.executor.submit(self._generate_thumbnail, cache_key, img_path, width)
+        if not already_queued:
+            self.executor.submit(self._generate_thumbnail, cache_key, img_path, width)
     
     def _generate_thumbnail(self, cache_key, img_path, width):
-        """Runs on worker thread - generates thumbnail."""
+        """Runs on worker thread - decodes the thumbnail into a QImage (QPixmap is GUI-thread only)."""
         try:
-            pixmap = get_or_make_qt_by_key(cache_key, img_path, width)
-            self.thumbnail_ready.emit(cache_key, pixmap)
+            start_time = time.perf_counter()
+            qimage = get_or_make_qimage_by_key(cache_key, img_path, width)
+            self.thumbnail_ready.emit(cache_key, qimage, time.perf_counter() - start_time)
         except Exception as e:
             log_error(f"Error generating thumbnail for {img_path}: {e}")
+            self.thumbnail_ready.emit(cache_key, QImage(), 0.0)  # lets a later load retry
     
-    def _update_button(self, cache_key, pixmap):
-        """Runs on main thread - updates button widget."""
-        if cache_key in self.buttons:
-            # print(f"updating button {cache_key}")
-            btn = self.buttons[cache_key]
+    def _update_button(self, cache_key, qimage, cost):
+        """Runs on main thread - uploads the pixmap and updates the button widget."""
+        if qimage.isNull():
+            self.buttons.pop(cache_key, None)
+            return
+        pixmap = QPixmap.fromImage(qimage)
+        with CACHE_LOCK:
+            QT_CACHE.put(cache_key, pixmap, cost)
+        btn = self.buttons.pop(cache_key, None)
+        # The button may have been recycled for another image in the meantime.
+        if btn is not None and getattr(btn, 'cache_key', None) == cache_key:
             btn.set_image(pixmap)
     
     def load_thumbnail_for_button(self, btn, img_path, width, border):
@@ -585,21 +817,27 @@ class ThumbnailLoader(QObject):
         
         # Check if thumbnail exists in Qt cache already
         with CACHE_LOCK:
-            if cache_key in QT_CACHE:
+            cached_pixmap = QT_CACHE.get(cache_key)
+            if cached_pixmap is not None:
                 # Use cached thumbnail immediately
-                QT_CACHE.move_to_end(cache_key)
-                btn.set_image(QT_CACHE[cache_key])
+                btn.set_image(cached_pixmap)
             else:
                 # Queue async thumbnail generation
                 self._load_async( cache_key, img_path, width, btn )
 
+    def forget_button(self, btn):
+        """Drop a pending delivery to a button that is about to be deleted."""
+        cache_key = getattr(btn, 'cache_key', None)
+        if self.buttons.get(cache_key) is btn:
+            del self.buttons[cache_key]
+
     def shutdown(self):
         self.buttons.clear()
         try:
             self.thumbnail_ready.disconnect(self._update_button)
         except TypeError:
             pass # Already disconnected        
-        self.executor.shutdown(wait=False)
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 
 # --- dialogue box ---
@@ -646,8 +884,11 @@ def set_wallpaper(image_path, error_callback=fallback_show_error):
             desktop_env = os.environ.get('DESKTOP_SESSION').lower()
         success = False
         if any(de in desktop_env for de in ['gnome', 'unity', 'pantheon', 'budgie']):
-            subprocess.run(['gsettings', 'set', 'org.gnome.desktop.background', 'picture-uri', file_uri])
-            subprocess.run(['gsettings', 'set', 'org.gnome.desktop.background', 'picture-uri-dark', file_uri])
+            # The light and dark keys are independent; set them concurrently.
+            processes = [subprocess.Popen(['gsettings', 'set', 'org.gnome.desktop.background', key, file_uri])
+                         for key in ('picture-uri', 'picture-uri-dark')]
+            for process in processes:
+                process.wait()
             success = True
         elif 'kde' in desktop_env:
             script = f"""
@@ -693,7 +934,10 @@ def set_wallpaper(image_path, error_callback=fallback_show_error):
                 ["gsettings", "set", "org.gnome.desktop.background", "picture-uri", f"{file_uri}"]
             ]
             for method in methods:
-                completed_process = subprocess.run(method)
+                try:
+                    completed_process = subprocess.run(method, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                except FileNotFoundError:
+                    continue # tool not installed, try the next one
                 if completed_process.returncode == 0:
                     success = True
                     break
@@ -709,51 +953,57 @@ def set_wallpaper(image_path, error_callback=fallback_show_error):
 
 
 # --- predictive preloading of thumbnails ---
-    
-def get_parent_directory(path):
-    return os.path.dirname(path)
 
-def list_subdirectories(parent_directory_path):
-    if not os.path.isdir(parent_directory_path):
-        return []
-    subdirectories = []
-    for item_name in os.listdir(parent_directory_path):
-        item_path = os.path.join(parent_directory_path, item_name)
-        if os.path.isdir(item_path):
-            subdirectories.append(item_path)
-    subdirectories.sort()
-    return subdirectories
-
-def list_relevant_files(dir_path):
-    file_list = list_image_files(dir_path)
-    file_list.extend(list_image_files(get_parent_directory(dir_path)))
-    for subdir in list_subdirectories(dir_path):
-        file_list.extend(list_image_files(subdir))
-    return file_list
-
-
-class BackgroundWorker:
+class BackgroundWorker(QObject):
+    """Prefetches the thumbnails of the picker's current directory."""
+    thumbnail_ready = Signal()  # emitted from the worker thread when thumbnail_queue needs draining
+    PREFETCH_WORKERS = 2  # keep the prefetch in the background; the visible grid has its own loader
+
     def background(self):
         while self.keep_running:
             old_size = self.current_size
             old_directory = self.current_dir
-            to_do_list = list_relevant_files(old_directory)
-            for path_name in to_do_list:
-                if not self.keep_running:
-                    return
-                self.barrier()
-                if self.keep_running and (old_size == self.current_size) and (old_directory == self.current_dir):
-                    self.path_name_queue.put(path_name)
-                else:
+            to_do_list = list_image_files(old_directory)
+            self.barrier()
+            if not self.is_current(old_directory, old_size):
+                continue
+            # Thumbnails are written to THUMBNAIL_CACHE_ROOT by the pool threads, which
+            # also decode them into QImages while QT_CACHE has room; the GUI thread
+            # only uploads those. run() cancels whatever is still queued on navigation.
+            try:
+                futures = [self.pool.submit(prefetch_thumbnail, path_name, old_size)
+                           for path_name in to_do_list]
+            except RuntimeError:
+                return  # pool has been shut down by stop()
+            self.futures = futures
+            for future in as_completed(futures):
+                if not self.is_current(old_directory, old_size):
+                    for pending in futures:
+                        pending.cancel()
                     break
-            while self.keep_running and (old_size == self.current_size) and (old_directory == self.current_dir):
+                if future.cancelled():
+                    continue
+                result = future.result()
+                if result is not None:
+                    self.thumbnail_queue.put(result)
+                    # One queued emission at a time; the slot drains everything queued so far.
+                    if not self.drain_pending:
+                        self.drain_pending = True
+                        self.thumbnail_ready.emit()
+            futures = None
+            self.futures = []
+            while self.is_current(old_directory, old_size):
                 time.sleep(2)
 
     def __init__(self, path, width):
+        super().__init__()
         self.keep_running = True
         self.current_size = width
         self.current_dir = path
-        self.path_name_queue = queue.Queue()
+        self.thumbnail_queue = queue.Queue()  # (cache_key, QImage, seconds it took)
+        self.drain_pending = False
+        self.pool = ThreadPoolExecutor(max_workers=self.PREFETCH_WORKERS)
+        self.futures = []
         self.worker = threading.Thread(target=self.background)
         self.block = threading.Event()
         self.worker.daemon = True
@@ -769,29 +1019,42 @@ class BackgroundWorker:
     def barrier(self):
         self.block.wait()
 
+    def is_current(self, directory, size):
+        return self.keep_running and (size == self.current_size) and (directory == self.current_dir)
+
     def run(self, dir_path, size):
         self.pause()
+        changed = not self.is_current(dir_path, size)
         self.current_size = size
         self.current_dir = dir_path
+        if changed:
+            for future in self.futures:
+                future.cancel()
         self.resume()
         
     def stop(self):
         self.keep_running = False
+        self.pool.shutdown(wait=False, cancel_futures=True)
         self.resume()
         
 
 def is_image_file_name(file_name):
-    return file_name.lower().endswith(SUPPORTED_IMAGE_EXTENSIONS)
+    return os.path.splitext(file_name)[1].lower() in IMAGE_EXTENSION_SET
         
 def is_image_file(file_path):
     file_name = os.path.basename(file_path)
     return os.path.isfile(file_path) and is_image_file_name(file_name)
+
+def is_image_direntry(entry):
+    # DirEntry caches the file type from the directory read, so no extra stat
+    # is needed except for symlinks.
+    return is_image_file_name(entry.name) and entry.is_file()
         
 def list_image_files(directory_path):
     if not os.path.isdir(directory_path):
         return []
-    full_paths = [os.path.join(directory_path, file) for file in os.listdir(directory_path)]
-    return [path for path in full_paths if is_image_file(path)]
+    with os.scandir(directory_path) as entries:
+        return [entry.path for entry in entries if is_image_direntry(entry)]
 
 
 # --- drag and drop support ---
@@ -812,7 +1075,7 @@ def bind_right_drop(target_widget, handle_right_drop):
 
 
 class DragController(QObject):
-    """Manages drag-and-drop state for a source widget."""
+    """Manages drag-and-drop state for a source widget (or, via on_press, whichever widget was pressed)."""
     
     def __init__(self, source_widget, make_ghost, click_handler, button, attribute_name, picker):
         super().__init__()
@@ -830,7 +1093,9 @@ class DragController(QObject):
         self.dragging = False
         self.dragging_widget = None
         
-    def on_press(self):
+    def on_press(self, source_widget=None):
+        if source_widget is not None:
+            self.source_widget = source_widget
         self.drag_start_x = QCursor.pos().x()
         self.drag_start_y = QCursor.pos().y()
         self.dragging_widget = self.source_widget
@@ -843,9 +1108,9 @@ class DragController(QObject):
     def on_motion(self):
         if self.drag_start_timer and self.drag_start_timer.isActive() and self.dragging_widget:
             current_pos = QCursor.pos()
-            distance_moved = math.sqrt((current_pos.x() - self.drag_start_x)**2 + 
-                                       (current_pos.y() - self.drag_start_y)**2)
-            if distance_moved > DRAG_THRESHOLD:
+            dx = current_pos.x() - self.drag_start_x
+            dy = current_pos.y() - self.drag_start_y
+            if dx * dx + dy * dy > DRAG_THRESHOLD * DRAG_THRESHOLD:
                 self.drag_start_timer.stop()
                 self.start_drag()
                 
@@ -882,14 +1147,20 @@ class DragController(QObject):
         QApplication.instance().removeEventFilter(self)
         x, y = QCursor.pos().x(), QCursor.pos().y()
         if self.ghost:
+            # Ghosts are parented to the manager window; without deleting them every
+            # drag would leave a hidden top-level dialog (and its pixmap) behind.
             self.ghost.close()
+            self.ghost.deleteLater()
             self.ghost = None
         
         # Find the widget under the cursor
         target_widget = QApplication.widgetAt(x, y)
         while target_widget:
-            if hasattr(target_widget, self.attribute_name):
-                getattr(target_widget, self.attribute_name)(self.dragging_widget)
+            # Drop handlers are per-instance attributes (see bind_drop), so look them
+            # up on the widget itself, once per level.
+            handle_drop = getattr(target_widget, self.attribute_name, None)
+            if handle_drop is not None:
+                handle_drop(self.dragging_widget)
                 break
             target_widget = target_widget.parent()
         
@@ -897,83 +1168,52 @@ class DragController(QObject):
         self.dragging_widget = None
 
 
-def bind_click_or_drag(source_widget, make_ghost, click_handler, picker):
-    """Sets up left-click-or-drag on a widget. Click toggles selection, drag moves selected files."""
-    controller = DragController(source_widget, make_ghost, click_handler, 1, 'handle_drop', picker)
-    source_widget._left_drag_controller = controller
-    # Override mouse events
-    original_press = source_widget.mousePressEvent
-    original_move = source_widget.mouseMoveEvent
-    original_release = source_widget.mouseReleaseEvent
-    
-    def new_press(event):
-        if event.button() == Qt.LeftButton:
-            controller.on_press()
-        else:
-            original_press(event)
-    
-    def new_move(event):
-        if controller.dragging_widget:
-            controller.on_motion()
-        else:
-            original_move(event)
-    
-    def new_release(event):
-        if event.button() == Qt.LeftButton and controller.dragging_widget:
-            controller.on_release()
-        else:
-            original_release(event)
-    
-    source_widget.mousePressEvent = new_press
-    source_widget.mouseMoveEvent = new_move
-    source_widget.mouseReleaseEvent = new_release
-
-
-def bind_right_click_or_drag(source_widget, make_ghost, right_click_handler, picker, shift_click_handler=None):
-    """Sets up right-click-or-drag on a widget. Right-click opens context menu, drag moves single file.
-    Shift+Right-click calls shift_click_handler if provided."""
-    controller = DragController(source_widget, make_ghost, right_click_handler, 3, 'handle_right_drop', picker)
-    source_widget._right_drag_controller = controller
-    source_widget._shift_right_click_handler = shift_click_handler
-    # We need to handle right button separately
-    original_press = source_widget.mousePressEvent
-    original_move = source_widget.mouseMoveEvent
-    original_release = source_widget.mouseReleaseEvent
-    
-    def new_press(event):
-        if event.button() == Qt.RightButton:
-            # Check for Shift modifier - if Shift is held, execute immediately
-            if event.modifiers() & Qt.ShiftModifier and shift_click_handler:
-                shift_click_handler(source_widget)
-                return
-            controller.on_press()
-        else:
-            if hasattr(source_widget, '_left_drag_controller'):
-                # Let left controller handle it
-                if event.button() == Qt.LeftButton:
-                    source_widget._left_drag_controller.on_press()
-                    return
-            original_press(event)
-    
-    def new_move(event):
-        if controller.dragging_widget:
-            controller.on_motion()
-        elif hasattr(source_widget, '_left_drag_controller') and source_widget._left_drag_controller.dragging_widget:
-            source_widget._left_drag_controller.on_motion()
-        else:
-            original_move(event)
-    
-    def new_release(event):
-        if event.button() == Qt.RightButton and controller.dragging_widget:
-            controller.on_release()
-        elif event.button() == Qt.LeftButton and hasattr(source_widget, '_left_drag_controller') and source_widget._left_drag_controller.dragging_widget:
-            source_widget._left_drag_controller.on_release()
-        else:
-            original_release(event)
-    
-    source_widget.mousePressEvent = new_press
-    source_widget.mouseMoveEvent = new_move
-    source_widget.mouseReleaseEvent = new_release
+class ClickOrDragFilter(QObject):
+    """Click-or-drag handling for many source widgets through one event filter.
+
+    Left click calls click_handler, left drag moves via 'handle_drop' targets;
+    right click calls right_click_handler (shift_right_click_handler with Shift),
+    right drag moves via 'handle_right_drop' targets; left double click calls
+    double_click_handler. Only one drag can be in progress, so two controllers serve all widgets.
+    """
+
+    def __init__(self, picker, make_ghost, click_handler, make_right_ghost, right_click_handler,
+                 shift_right_click_handler=None, double_click_handler=None):
+        super().__init__(picker)
+        self.left_controller = DragController(None, make_ghost, click_handler, 1, 'handle_drop', picker)
+        self.right_controller = DragController(None, make_right_ghost, right_click_handler, 3, 'handle_right_drop', picker)
+        self.shift_right_click_handler = shift_right_click_handler
+        self.double_click_handler = double_click_handler
+
+    def eventFilter(self, source_widget, event):
+        event_type = event.type()
+        if event_type == QEvent.MouseButtonDblClick and event.button() == Qt.LeftButton and self.double_click_handler:
+            self.double_click_handler(source_widget)
+            return True
+        if event_type in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
+            if event.button() == Qt.RightButton:
+                # Check for Shift modifier - if Shift is held, execute immediately
+                if event.modifiers() & Qt.ShiftModifier and self.shift_right_click_handler:
+                    self.shift_right_click_handler(source_widget)
+                else:
+                    self.right_controller.on_press(source_widget)
+                return True
+            if event.button() == Qt.LeftButton:
+                self.left_controller.on_press(source_widget)
+                return True
+        elif event_type == QEvent.MouseMove:
+            for controller in (self.right_controller, self.left_controller):
+                if controller.dragging_widget:
+                    controller.on_motion()
+                    return True
+        elif event_type == QEvent.MouseButtonRelease:
+            if event.button() == Qt.RightButton and self.right_controller.dragging_widget:
+                self.right_controller.on_release()
+                return True
+            if event.button() == Qt.LeftButton and self.left_controller.dragging_widget:
+                self.left_controller.on_release()
+                return True
+        return False
 
 
 # --- helper to get font from widget hierarchy ---
@@ -1073,10 +1313,53 @@ class EditableLabelWithCopy(QWidget):
             self.original_text = new_text
 
 
+def mip_level_for(mip_levels, width, height):
+    """Smallest level of a halving pyramid over mip_levels[0] that is still at least twice (width, height).
+
+    Levels are built on demand and appended to mip_levels; smooth scaling from
+    there looks the same as from the original but touches a fraction of the pixels.
+    """
+    if mip_levels[0].mode not in ("L", "LA", "RGB", "RGBA"):
+        return mip_levels[0]  # palette and exotic modes do not box-reduce meaningfully
+    level = 0
+    while True:
+        image = mip_levels[level]
+        if image.width < 4 * width or image.height < 4 * height:
+            return image
+        level += 1
+        if level == len(mip_levels):
+            mip_levels.append(image.reduce(2))
+
+def render_display_image(mip_levels, width, height, flip, rotation):
+    display_image = mip_level_for(mip_levels, width, height)
+    if flip:
+        display_image = display_image.transpose( Image.FLIP_LEFT_RIGHT )
+    # Qt's raster scaler is several times faster than PIL's LANCZOS and the
+    # pyramid keeps the downscale factor small enough for it to look the same.
+    qimage = pil_to_qimage(display_image).scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    if rotation > 0:
+        qimage = qimage.transformed( QTransform().rotate( -90 * rotation ) )
+    return qimage
+
+
+def prefetch_neighbour_images(directory, list_cmd, img_path):
+    """Decode the images after and before img_path in its listing into PIL_CACHE."""
+    files = list_image_files_by_command(directory, list_cmd)
+    try:
+        index = files.index(img_path)
+    except ValueError:
+        return
+    for neighbour in files[index + 1:index + 2] + files[max(0, index - 1):index]:
+        get_full_size_image(neighbour)
+
+
 class ImageViewer(QMainWindow):
+    render_ready = Signal(int, object, QImage, float)  # (seq, render key, image, seconds it took)
+
     def __init__(self, master, image_info):
         super().__init__(master)
         self.master = master
+        self.setAttribute(Qt.WA_DeleteOnClose)
         self.setWindowTitle("kubux image manager")
         self.image_path = image_info[0]
         self.file_name = os.path.basename(self.image_path)
@@ -1098,8 +1381,31 @@ class ImageViewer(QMainWindow):
         if self.original_image is None:
             log_error(f"Cannot load image: {self.image_path}")
             raise ValueError(f"Cannot load image: {self.image_path}")
-        self.display_image = None
         self.photo_image = None
+        # Rendered pixmaps of the current image, keyed by (width, height, flip, rotation),
+        # so going back and forth between zoom levels does not resample again.
+        self._pixmap_cache = ByteBudgetCache(VIEWER_PIXMAP_CACHE_BYTES, qpixmap_bytes)
+        self._mip_levels = [self.original_image]
+        self.pending_update = True  # first render happens in showEvent
+        # One timer coalesces the stream of resize events of an interactive resize.
+        self.resize_job = QTimer(self)
+        self.resize_job.setSingleShot(True)
+        self.resize_job.timeout.connect(self._on_resize_debounce)
+        self.requested_render_key = None  # shown or in flight
+        # Renders run on a single worker; render_seq identifies the latest request.
+        self.render_pool = ThreadPoolExecutor(max_workers=1)
+        self.render_seq = 0
+        self.first_seq_of_image = 0
+        self.render_ready.connect(self._on_render_ready, Qt.QueuedConnection)
+        # Neighbours are decoded ahead on a separate worker so they never delay a render.
+        self.prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self.prefetch_future = None
+        # One timer coalesces all zoom steps of a burst into a single render.
+        self.zoom_job = QTimer(self)
+        self.zoom_job.setSingleShot(True)
+        self.zoom_job.timeout.connect(self._update_image)
+        self.zoom_anchor = None
+        self.pending_scroll = None
 
         if self.window_geometry is not None:
             self.restoreGeometry(QByteArray.fromBase64(self.window_geometry.encode()))
@@ -1159,7 +1465,6 @@ class ImageViewer(QMainWindow):
         self.panning = False
 
         self._update_title()
-        self._update_image()
 
         self.scroll_area.setMouseTracking(True)
         self.canvas.setMouseTracking(True)
@@ -1168,16 +1473,16 @@ class ImageViewer(QMainWindow):
         self.canvas.mouseReleaseEvent = self._on_mouse_up
         self.canvas.wheelEvent = self._on_mouse_wheel
 
+        # Restore scroll position once the first render is shown
+        if self.window_geometry is not None and (self.stored_scroll_x > 0 or self.stored_scroll_y > 0):
+            self.pending_scroll = (self.stored_scroll_x, self.stored_scroll_y)
+
         self.set_screen_mode(self.is_fullscreen)
         self.show()
         self.activateWindow()
         self.canvas.setFocus()
+        self._prefetch_neighbours()
 
-        # Restore scroll position after _update_image has rendered
-        if self.window_geometry is not None and self.stored_scroll_y > 0:
-            QTimer.singleShot(200, lambda: self.scroll_area.verticalScrollBar().setValue(self.stored_scroll_y))
-        if self.window_geometry is not None and self.stored_scroll_x > 0:
-            QTimer.singleShot(200, lambda: self.scroll_area.horizontalScrollBar().setValue(self.stored_scroll_x))
 
     def get_image_info(self):
         geom = self.saveGeometry().toBase64().data().decode()
@@ -1194,7 +1499,7 @@ class ImageViewer(QMainWindow):
         else:
             self.showNormal()
         self.is_fullscreen = is_fullscreen
-        QTimer.singleShot(100, self._update_image)
+        # In fit-to-window mode the resulting resizeEvent re-renders; otherwise nothing changed.
 
     def toggle_fullscreen(self):
         self.is_fullscreen = not self.is_fullscreen
@@ -1212,6 +1517,11 @@ class ImageViewer(QMainWindow):
     def _update_image(self):
         if not self.original_image:
             return
+        if not self.isVisible() or self.isMinimized():
+            # Nobody would see the result; render when the window comes back.
+            self.pending_update = True
+            return
+        self.pending_update = False
         canvas_width = self.scroll_area.viewport().width()
         canvas_height = self.scroll_area.viewport().height()
         if canvas_width <= 1:
@@ -1230,20 +1540,65 @@ class ImageViewer(QMainWindow):
             new_width = int(orig_width * self.zoom_factor)
             new_height = int(orig_height * self.zoom_factor)
 
-        self.display_image = self.original_image
-        if self.flip:
-            self.display_image = self.display_image.transpose( Image.FLIP_LEFT_RIGHT )
-        self.display_image = self.display_image.resize(
-            (new_width, new_height), 
-            Image.LANCZOS
-        )
-        if self.rotation > 0:
-            self.display_image = self.display_image.transpose( IMAGE_TRANSFORM[ self.rotation ] )
+        render_key = (new_width, new_height, self.flip, self.rotation)
+        if render_key == self.requested_render_key:
+            self.zoom_anchor = None  # nothing moves, nothing to re-anchor
+            return
+        self.requested_render_key = render_key
+        pixmap = self._pixmap_cache.get(render_key)
+        if pixmap is not None:
+            self.render_seq += 1  # anything still in flight is stale now
+            self._show_pixmap(pixmap)
+            return
+        self.render_seq += 1
+        try:
+            self.render_pool.submit(self._render_in_background, self.render_seq, render_key, self._mip_levels)
+        except RuntimeError:
+            pass # pool has been shut down, window is closing
 
-        pixmap = pil_to_qpixmap(self.display_image)
+    def _render_in_background(self, seq, render_key, mip_levels):
+        """Runs on worker thread - resamples and converts; QPixmap is left to the GUI thread."""
+        try:
+            start_time = time.perf_counter()
+            qimage = render_display_image(mip_levels, *render_key)
+            self.render_ready.emit(seq, render_key, qimage, time.perf_counter() - start_time)
+        except RuntimeError:
+            pass # window deleted while rendering
+        except Exception as e:
+            log_error(f"Error rendering {self.image_path}: {e}")
+            try:
+                self.render_ready.emit(seq, render_key, QImage(), 0.0)  # lets _update_image retry
+            except RuntimeError:
+                pass # window deleted while rendering
+
+    def _on_render_ready(self, seq, render_key, qimage, cost):
+        """Runs on main thread - caches every result, shows only the latest request."""
+        if seq < self.first_seq_of_image:
+            return  # rendered from the previous image
+        if qimage.isNull():
+            if render_key == self.requested_render_key:
+                self.requested_render_key = None
+            return
+        pixmap = QPixmap.fromImage(qimage)
+        self._pixmap_cache.put(render_key, pixmap, cost)
+        if seq == self.render_seq:
+            self._show_pixmap(pixmap)
+
+    def _show_pixmap(self, pixmap):
         self.canvas.setPixmap(pixmap)
         self.canvas.resize(pixmap.size())
-
+        if self.zoom_anchor is not None:
+            x_fraction, y_fraction, cursor_vp_x, cursor_vp_y = self.zoom_anchor
+            self.zoom_anchor = None
+            new_x = x_fraction * self.canvas.width()
+            new_y = y_fraction * self.canvas.height()
+            self.scroll_area.horizontalScrollBar().setValue(int(max(0, new_x - cursor_vp_x)))
+            self.scroll_area.verticalScrollBar().setValue(int(max(0, new_y - cursor_vp_y)))
+        if self.pending_scroll is not None:
+            scroll_x, scroll_y = self.pending_scroll
+            self.pending_scroll = None
+            self.scroll_area.horizontalScrollBar().setValue(scroll_x)
+            self.scroll_area.verticalScrollBar().setValue(scroll_y)
 
     def _do_rotate ( self ):
         self.fit_to_window = False
@@ -1288,13 +1643,28 @@ class ImageViewer(QMainWindow):
             self.file_name = os.path.basename(self.image_path)
             self.dir_name = os.path.dirname(self.image_path)
             self.original_image = new_image
-            self.display_image = None
+            self._pixmap_cache = ByteBudgetCache(VIEWER_PIXMAP_CACHE_BYTES, qpixmap_bytes)
+            self._mip_levels = [self.original_image]
+            self.first_seq_of_image = self.render_seq + 1
+            self.requested_render_key = None
             self.photo_image = None
             ow, oh = self.original_image.size
             self.filename_widget.set_info( f"{ow}x{oh}" )
             self.filename_widget.set_text( self.file_name )
             self._update_title()
             self._update_image()
+            self._prefetch_neighbours()
+
+    def _prefetch_neighbours ( self ):
+        if not (self.picker_dir and self.picker_cmd):
+            return
+        if self.prefetch_future:
+            self.prefetch_future.cancel()  # still queued: the user has moved on already
+        try:
+            self.prefetch_future = self.prefetch_pool.submit(
+                prefetch_neighbour_images, self.picker_dir, self.picker_cmd, self.image_path)
+        except RuntimeError:
+            pass # pool has been shut down, window is closing
 
     def goto_next ( self ):
         self.set_image( self.next_file() )
@@ -1334,6 +1704,8 @@ class ImageViewer(QMainWindow):
             self._zoom_out()
         elif key == Qt.Key_0:
             self.fit_to_window = True
+            self.zoom_anchor = None
+            self.zoom_job.stop()
             self._update_image()
         elif key == Qt.Key_F:
             self._toggle_flip()
@@ -1353,21 +1725,27 @@ class ImageViewer(QMainWindow):
     def _on_mouse_down(self, event):
         if event.button() == Qt.LeftButton:
             self.panning = True
-            self.pan_start_x = event.globalX()
-            self.pan_start_y = event.globalY()
+            # Global coordinates: the canvas itself moves while we scroll.
+            pos = event.globalPosition().toPoint()
+            self.pan_start_x = pos.x()
+            self.pan_start_y = pos.y()
             self.canvas.setCursor(Qt.ClosedHandCursor)
 
     def _on_mouse_drag(self, event):
         if not self.panning:
             return
-        dx = self.pan_start_x - event.globalX()
-        dy = self.pan_start_y - event.globalY()
-        h_bar = self.scroll_area.horizontalScrollBar()
-        v_bar = self.scroll_area.verticalScrollBar()
-        h_bar.setValue(h_bar.value() + dx)
-        v_bar.setValue(v_bar.value() + dy)
-        self.pan_start_x = event.globalX()
-        self.pan_start_y = event.globalY()
+        pos = event.globalPosition().toPoint()
+        dx = self.pan_start_x - pos.x()
+        dy = self.pan_start_y - pos.y()
+        self.pan_start_x = pos.x()
+        self.pan_start_y = pos.y()
+        # Each setValue scrolls the canvas; skip the axis that did not move.
+        if dx:
+            h_bar = self.scroll_area.horizontalScrollBar()
+            h_bar.setValue(h_bar.value() + dx)
+        if dy:
+            v_bar = self.scroll_area.verticalScrollBar()
+            v_bar.setValue(v_bar.value() + dy)
 
     def _on_mouse_up(self, event):
         if event.button() == Qt.LeftButton:
@@ -1376,52 +1754,65 @@ class ImageViewer(QMainWindow):
 
     def _on_mouse_wheel(self, event):
         # log_debug(f"X = {event.position().x()}, Y = {event.position().y()}")
-        delta = event.angleDelta().y()
-        if delta > 0:
-            self._zoom_in(event.position().x(), event.position().y())
-        else:
-            self._zoom_out(event.position().x(), event.position().y())
+        # 120 units per notch; high-resolution wheels and touchpads send fractions,
+        # fast spins several notches at once.
+        steps = event.angleDelta().y() / 120.0
+        if steps == 0:
+            return
+        self._zoom(1.25 ** steps, event.position().x(), event.position().y())
+        self._fall_back_to_fit()
 
 
     def resizeEvent(self, event):
         if self.fit_to_window:
-            self._update_image()
+            self.resize_job.start(40)
         super().resizeEvent(event)
 
+    def _on_resize_debounce(self):
+        if self.fit_to_window:
+            self._update_image()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.pending_update:
+            self._update_image()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and self.pending_update:
+            self._update_image()
+
     def _zoom(self, factor, x=None, y=None):
         """Apply a zoom factor, optionally keeping (x, y) centered.
         x and y are image coordinates (position within the QLabel which is sized
         to the image). Qt gives us image coords directly; no scroll offset needed.
+        Rendering is debounced, so a fast wheel only renders the final zoom level.
         """
         self.fit_to_window = False
         self.zoom_factor *= factor
 
         if x is not None and y is not None:
-            x_fraction = x / self.display_image.width
-            y_fraction = y / self.display_image.height
+            # The canvas still shows the last rendered level, so these stay
+            # consistent across all wheel events of one burst.
             h_bar = self.scroll_area.horizontalScrollBar()
             v_bar = self.scroll_area.verticalScrollBar()
-            cursor_vp_x = x - h_bar.value()   # cursor offset within viewport
-            cursor_vp_y = y - v_bar.value()
-
-        self._update_image()
-
-        if x is not None and y is not None:
-            new_x = x_fraction * self.display_image.width
-            new_y = y_fraction * self.display_image.height
-            h_bar.setValue(int(max(0, new_x - cursor_vp_x)))
-            v_bar.setValue(int(max(0, new_y - cursor_vp_y)))
+            self.zoom_anchor = (x / self.canvas.width(), y / self.canvas.height(),
+                                x - h_bar.value(), y - v_bar.value())  # cursor offset within viewport
 
+        self.zoom_job.start(30)  # the zoom anchor is applied when the result is shown
 
     def _zoom_in(self, x=None, y=None):
         self._zoom(1.25, x, y)
 
     def _zoom_out(self, x=None, y=None):
         self._zoom(1 / 1.25, x, y)
+        self._fall_back_to_fit()
+
+    def _fall_back_to_fit(self):
         min_zoom = 0.1
         if self.zoom_factor < min_zoom:
             self.fit_to_window = True
-            self._update_image()
+            self.zoom_anchor = None
 
     def _rename_current_image(self, old_name, new_name):
         try:
@@ -1446,6 +1837,8 @@ class ImageViewer(QMainWindow):
         if self in self.master.open_images:
             self.master.open_images.remove(self)
             self.master._check_ephemeral_exit()
+        self.render_pool.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_pool.shutdown(wait=False, cancel_futures=True)
         event.accept()
 
 
@@ -1456,7 +1849,7 @@ class ThumbnailButton(QPushButton):
         self.item_border_width = item_border_width
         self.cache_key = None
         self.qt_image = None
-        self._double_click_handler = None
+        self.is_selected = False
         self.setCursor(Qt.PointingHandCursor)
         self.setStyleSheet(f"padding: 0px; margin: 0px; border: {self.item_border_width}px solid transparent;")
         
@@ -1468,13 +1861,6 @@ class ThumbnailButton(QPushButton):
                          self.height() - 2 * self.item_border_width)
         self.setIconSize(icon_size)
 
-    def mouseDoubleClickEvent(self, event):
-        if event.button() == Qt.LeftButton and self._double_click_handler:
-            self._double_click_handler()
-            event.accept()
-        else:
-            super().mouseDoubleClickEvent(event)
-
 
 class DirectoryThumbnailGrid:
     """Helper class for managing thumbnail buttons, caching, and file lists.
@@ -1527,8 +1913,15 @@ class DirectoryThumbnailGrid:
             self._widget_cache.move_to_end(cache_key)
         
         # Clean up old cached widgets
+        # Active buttons were just touched and sit at the new end, so eviction stops at
+        # the first one; a layout pass needing more than _cache_size buttons grows the cache.
         while len(self._widget_cache) > self._cache_size:
-            self._widget_cache.popitem(last=False)
+            old_key, old_btn = next(iter(self._widget_cache.items()))
+            if old_btn is btn or self._active_widgets.get(getattr(old_btn, 'img_path', None)) is old_btn:
+                break
+            del self._widget_cache[old_key]
+            self.thumbnail_loader.forget_button(old_btn)
+            old_btn.deleteLater()
         
         return btn
 
@@ -1797,7 +2190,10 @@ class ThumbnailArea(QScrollArea):
     
     def resizeEvent(self, event):
         super().resizeEvent( event )
-        self._recalculate_grid()
+        # Row heights depend on the column count only; while it stays the same a
+        # resize just repositions the visible buttons, with no pass over all files.
+        if self._calculate_columns( self._vp_width() ) != self._cols:
+            self._recalculate_grid()
         self.move_scrollbar( self._scroll_pos_from_index( self._center_idx ) )
         self._render_viewport()
     
@@ -1813,7 +2209,8 @@ class ThumbnailArea(QScrollArea):
         self._render_viewport()
 
     def refresh(self):
-        self._render_viewport()
+        """Re-apply per-button state (selection) to the visible thumbnails without re-laying them out."""
+        self.grid.refresh_buttons()
 
     def regrid(self):
         old_value = get_watch_for_changes()
@@ -1864,8 +2261,7 @@ class LongMenu(QDialog):
         self._listbox.setMinimumWidth(char_width * max_length)
         self._listbox.setMinimumHeight(20 + fm.height() * min(n_lines, len(self._options)))
 
-        for option_name in other_options:
-            self._listbox.addItem(option_name)
+        self._listbox.addItems(other_options)
 
         layout.addWidget(self._listbox)
 
@@ -1932,7 +2328,9 @@ class BreadCrumNavigator(QWidget):
         self._current_path = ""
         self._LONG_PRESS_THRESHOLD_MS = long_press_threshold_ms
         self._DRAG_THRESHOLD_PIXELS = drag_threshold_pixels
-        self._long_press_timer = None
+        self._long_press_timer = QTimer(self)
+        self._long_press_timer.setSingleShot(True)
+        self._long_press_timer.timeout.connect(self._on_long_press_timeout)
         self._press_start_time = 0
         self._press_x = 0
         self._press_y = 0
@@ -1953,16 +2351,12 @@ class BreadCrumNavigator(QWidget):
         if not os.path.isdir(path):
             return
         self._current_path = os.path.normpath(path)
-        self._segment_data = []
-        p = self._current_path
-        while len(p) > 1:
-            parent = os.path.dirname(p)
-            name = os.path.basename(p)
-            if name == '':
-                name = os.path.sep
-            self._segment_data.insert(0, (p, name))
-            p = parent
-        self._segment_data.insert(0, (p, "//"))
+        p = os.path.sep if self._current_path.startswith(os.path.sep) else ''
+        self._segment_data = [(p, "//")]
+        for name in self._current_path.split(os.path.sep):
+            if name:
+                p = os.path.join(p, name)
+                self._segment_data.append((p, name))
         self._reflow()
 
     def resizeEvent(self, event):
@@ -2160,43 +2554,38 @@ class BreadCrumNavigator(QWidget):
         self._press_x = QCursor.pos().x()
         self._press_y = QCursor.pos().y()
         self._active_button = button
-        self._long_press_timer = QTimer(self)
-        self._long_press_timer.setSingleShot(True)
-        self._long_press_timer.timeout.connect(lambda: self._on_long_press_timeout(button))
         self._long_press_timer.start(self._LONG_PRESS_THRESHOLD_MS)
 
     def _on_button_release(self, button):
-        if self._long_press_timer and self._long_press_timer.isActive():
-            self._long_press_timer.stop()
+        self._long_press_timer.stop()
         if self._active_button:
             current_pos = QCursor.pos()
-            dist = math.sqrt((current_pos.x() - self._press_x)**2 + (current_pos.y() - self._press_y)**2)
-            if dist < self._DRAG_THRESHOLD_PIXELS:
+            dx = current_pos.x() - self._press_x
+            dy = current_pos.y() - self._press_y
+            if dx * dx + dy * dy < self._DRAG_THRESHOLD_PIXELS * self._DRAG_THRESHOLD_PIXELS:
                 if (time.time() - self._press_start_time) * 1000 < self._LONG_PRESS_THRESHOLD_MS:
                     path = self._active_button.path
                     if path and self._on_navigate_callback:
                         self._on_navigate_callback(path)
             self._active_button = None
 
-    def _on_long_press_timeout(self, button):
-        if self._active_button is button:
-            self._show_subdirectory_menu(button)
-            self._long_press_timer = None
+    def _on_long_press_timeout(self):
+        if self._active_button:
+            self._show_subdirectory_menu(self._active_button)
 
     def _show_subdirectory_menu(self, button):
         path = button.path
         selected_path = path
 
-        all_entries = os.listdir(path)
         subdirs = []
         hidden_subdirs = []
-        for entry in all_entries:
-            full_path = os.path.join(path, entry)
-            if os.path.isdir(full_path):
-                if entry.startswith('.'):
-                    hidden_subdirs.append(entry)
-                else:
-                    subdirs.append(entry)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name.startswith('.'):
+                        hidden_subdirs.append(entry.name)
+                    else:
+                        subdirs.append(entry.name)
         subdirs.sort()
         hidden_subdirs.sort()
         sorted_subdirs = subdirs + hidden_subdirs
@@ -2226,6 +2615,7 @@ class ImagePicker(QMainWindow):
     def __init__(self, master, picker_info=None):
         super().__init__(master)
         self.master = master
+        self.setAttribute(Qt.WA_DeleteOnClose)  # a closed picker is never reopened; do not keep it as master's child
         self.setWindowTitle("kubux image manager")
         self.thumbnail_width = picker_info[0]
         self.image_dir = picker_info[1]
@@ -2235,8 +2625,15 @@ class ImagePicker(QMainWindow):
         self.old_sizing_mode = self.sizing_mode
         self.update_sizing_mode_timer = None
         self.background_worker = BackgroundWorker(self.image_dir, self.thumbnail_width)
+        self.background_worker.thumbnail_ready.connect(self._cache_widget, Qt.QueuedConnection)
         self.update_thumbnail_job_id = None
+        self.pending_regrid = False
         self.watcher = DirectoryWatcher(self)
+        self._thumbnail_mouse_filter = ClickOrDragFilter(
+            self, self._make_ghost, self._toggle_selection,
+            self._make_right_ghost, self._open_right_click_context_menu,
+            shift_right_click_handler=self._exec_cmd_for_image,
+            double_click_handler=self._open_image_of_button)
         
         if self.window_geometry:
             self.restoreGeometry(QByteArray.fromBase64(self.window_geometry.encode()))
@@ -2248,10 +2645,6 @@ class ImagePicker(QMainWindow):
         self._gallery_grid.move_scrollbar( picker_info[5] )
         self._redraw()
         self._update_sizing_ui()
-        self._cache_timer = QTimer(self)
-        self._cache_timer.timeout.connect(self._cache_widget)
-        
-        # self._cache_timer.start(50)
 
         self.rational_fractions = sorted( [ p/q for q in [1,2,3,4,5,6,7,8,9,10,12,15,20,24] for p in range(1, q + 1) if gcd(p, q) == 1 ] )
 
@@ -2271,13 +2664,30 @@ class ImagePicker(QMainWindow):
         return ( max( possible ) );
 
 
+    CACHE_DRAIN_BATCH = 32
+
     def _cache_widget(self):
-        try:
-            path_name = self.background_worker.path_name_queue.get_nowait()
-            # self._gallery_grid.get_button(path_name, self.thumbnail_width)
-            get_or_make_pil(path_name, self.thumbnail_width)
-        except queue.Empty:
-            pass
+        """Runs on main thread; uploads the thumbnails the background worker has decoded.
+
+        Takes at most CACHE_DRAIN_BATCH per event-loop turn so input stays responsive.
+        """
+        worker = self.background_worker
+        worker.drain_pending = False
+        for _ in range(self.CACHE_DRAIN_BATCH):
+            try:
+                cache_key, qimage, cost = worker.thumbnail_queue.get_nowait()
+            except queue.Empty:
+                return
+            # Prefetch only into spare room; never push out thumbnails that are on screen.
+            with CACHE_LOCK:
+                wanted = QT_CACHE.has_room() and cache_key not in QT_CACHE
+            if wanted:
+                pixmap = QPixmap.fromImage(qimage)
+                with CACHE_LOCK:
+                    QT_CACHE.put_if_room(cache_key, pixmap, cost)
+        if not worker.drain_pending:
+            worker.drain_pending = True
+            QTimer.singleShot(0, self._cache_widget)
 
     def get_picker_info(self):
         geom = self.saveGeometry().toBase64().data().decode()
@@ -2320,6 +2730,24 @@ class ImagePicker(QMainWindow):
     def _regrid(self):
         self._gallery_grid.set_size_path_and_command(self.thumbnail_width, self.image_dir, self.list_cmd)
 
+    def _regrid_when_visible(self):
+        """Regrid now, or on the next show if the picker is hidden or minimized."""
+        if not self.isVisible() or self.isMinimized():
+            self.pending_regrid = True
+            return
+        self.pending_regrid = False
+        self._regrid()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.pending_regrid:
+            self._regrid_when_visible()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and self.pending_regrid:
+            self._regrid_when_visible()
+
     def _redraw(self):
         self._gallery_grid.redraw()
 
@@ -2333,6 +2761,7 @@ class ImagePicker(QMainWindow):
         main_layout.setContentsMargins(5, 5, 5, 5)
         main_layout.setSpacing(5)
 
+        font = get_font(self)
         self.available_screen_width = QGuiApplication.primaryScreen().availableGeometry().width() - MIN_THUMBNAIL_SIZE;
 
         # Top bar
@@ -2343,22 +2772,22 @@ class ImagePicker(QMainWindow):
         self.breadcrumb_nav = BreadCrumNavigator(
             self._top_frame,
             on_navigate_callback=self._browse_directory,
-            font=get_font(self)
+            font=font
         )
         top_layout.addWidget(self.breadcrumb_nav, 1)
         
         shell_btn = QPushButton("Shell")
-        shell_btn.setFont(get_font(self))
+        shell_btn.setFont(font)
         shell_btn.clicked.connect(self._on_shell)
         top_layout.addWidget(shell_btn)
 
         clone_btn = QPushButton("Clone")
-        clone_btn.setFont(get_font(self))
+        clone_btn.setFont(font)
         clone_btn.clicked.connect(self._on_clone)
         top_layout.addWidget(clone_btn)
         
         close_btn = QPushButton("Close")
-        close_btn.setFont(get_font(self))
+        close_btn.setFont(font)
         close_btn.clicked.connect(self._on_close)
         top_layout.addWidget(close_btn)
         
@@ -2387,7 +2816,7 @@ class ImagePicker(QMainWindow):
         bot_layout.setContentsMargins(0, 0, 0, 0)
         
         self.size_menu_button = QPushButton("Size:")
-        self.size_menu_button.setFont(get_font(self))
+        self.size_menu_button.setFont(font)
         self.size_menu_button.clicked.connect(self._show_sizing_menu)
         bot_layout.addWidget(self.size_menu_button)
         
@@ -2401,28 +2830,28 @@ class ImagePicker(QMainWindow):
         bot_layout.addWidget(self.thumbnail_slider)
         
         show_label = QLabel("Show:")
-        show_label.setFont(get_font(self))
+        show_label.setFont(font)
         bot_layout.addWidget(show_label)
         
         self.list_cmd_entry = QLineEdit(self.list_cmd)
-        self.list_cmd_entry.setFont(get_font(self))
+        self.list_cmd_entry.setFont(font)
         self.list_cmd_entry.returnPressed.connect(self._update_list_cmd)
         self.list_cmd_entry.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list_cmd_entry.customContextMenuRequested.connect(self._show_list_cmd_menu)
         bot_layout.addWidget(self.list_cmd_entry, 1)
         
         desel_btn = QPushButton("Des.")
-        desel_btn.setFont(get_font(self))
+        desel_btn.setFont(font)
         desel_btn.clicked.connect(self._on_deselect)
         bot_layout.addWidget(desel_btn)
         
         sel_btn = QPushButton("Sel.")
-        sel_btn.setFont(get_font(self))
+        sel_btn.setFont(font)
         sel_btn.clicked.connect(self._on_select)
         bot_layout.addWidget(sel_btn)
         
         self.apply_btn = QPushButton("Apply")
-        self.apply_btn.setFont(get_font(self))
+        self.apply_btn.setFont(font)
         self.apply_btn.clicked.connect(self._on_apply)
         bot_layout.addWidget(self.apply_btn)
         
@@ -2497,7 +2926,10 @@ class ImagePicker(QMainWindow):
         self.master.execute_command_with_args(self.master.command_field.current_command(), args)
 
     def _static_configure_picker_button(self, btn, img_path):
-        pass
+        btn.installEventFilter(self._thumbnail_mouse_filter)
+
+    def _open_image_of_button(self, btn):
+        self.master.open_image_file(btn.img_path, self.image_dir, self.list_cmd)
 
     def _toggle_selection(self, btn):
         self.master.toggle_selection(btn.img_path, self.image_dir, self.list_cmd)
@@ -2526,14 +2958,12 @@ class ImagePicker(QMainWindow):
         if btn.cache_key != cache_key:
             self._gallery_grid.load_thumbnail_for_button(btn, img_path, self.thumbnail_width)
         
-        if not hasattr(btn, '_drag_connected'):
-            bind_click_or_drag(btn, self._make_ghost, self._toggle_selection, self)
-            bind_right_click_or_drag(btn, self._make_right_ghost, self._open_right_click_context_menu, self, 
-                                     shift_click_handler=self._exec_cmd_for_image)
-            btn._double_click_handler = lambda: self.master.open_image_file(btn.img_path, self.image_dir, self.list_cmd)
-            btn._drag_connected = True
-        
-        if any(img_path == entry[0] for entry in self.master.selected_files):
+        # Re-polishing a style sheet is costly; only touch buttons whose state changed.
+        is_selected = any(img_path == entry[0] for entry in self.master.selected_files)
+        if btn.is_selected == is_selected:
+            return
+        btn.is_selected = is_selected
+        if is_selected:
             btn.setStyleSheet(f"padding: 0px; margin: 0px; border: {btn.item_border_width}px solid blue;")
         else:
             btn.setStyleSheet(f"padding: 0px; margin: 0px; border: {btn.item_border_width}px solid transparent;")
@@ -2544,7 +2974,6 @@ class ImagePicker(QMainWindow):
     def _on_close(self):
         self.background_worker.stop()
         self.watcher.stop_watching()
-        self._cache_timer.stop()
         self._gallery_grid.shutdown()
         self.master.open_picker_dialogs.remove(self)
         self.master._check_ephemeral_exit()
@@ -2561,7 +2990,8 @@ class ImagePicker(QMainWindow):
             self.master.unselect_file(file)
 
     def _on_apply(self):
-        files = [(f, d, c) for f, d, c in self.master.selected_files if is_file_in_dir(f, self.image_dir)]
+        is_in_dir = make_is_file_in_dir(self.image_dir)
+        files = [(f, d, c) for f, d, c in self.master.selected_files if is_in_dir(f)]
         options = self.master.command_field.current_cmd_list()
         btn_pos = self.apply_btn.mapToGlobal(QPoint(0, 0))
         context_menu = LongMenu(
@@ -2601,6 +3031,8 @@ class ImagePicker(QMainWindow):
             custom_message_dialog(parent=self, title="Error", message=f"Invalid directory: {path}",
                                   font=get_font(self))
             return
+        if os.path.normpath(path) == os.path.normpath(self.image_dir):
+            return  # the watcher already keeps the current listing up to date
         self.image_dir = path
         self.watcher.change_dir(path)
         self.background_worker.run(path, self.thumbnail_width)
@@ -2617,6 +3049,8 @@ class ImagePicker(QMainWindow):
             self, 400, lambda: self._do_update_thumbnail_width(value) )
 
     def _do_update_thumbnail_width(self, value):
+        if value == self.thumbnail_width:
+            return
         self.thumbnail_slider.blockSignals(True)
         self.thumbnail_width = value
         self.thumbnail_slider.blockSignals(False)
@@ -2667,7 +3101,6 @@ class ImagePicker(QMainWindow):
             available_col_width = self._gallery_grid.compute_width_for_columns(col_count)
             new_thumbnail_width = max( MIN_THUMBNAIL_SIZE, self.floor_thumbnail_width( available_col_width ) )
             self._do_update_thumbnail_width( new_thumbnail_width )
-            self._regrid()
             self._update_sizing_ui()
         self.old_sizing_mode = self.sizing_mode
 
@@ -2743,7 +3176,7 @@ class ImagePicker(QMainWindow):
         if self in self.master.open_picker_dialogs:
             self.background_worker.stop()
             self.watcher.stop_watching()
-            self._cache_timer.stop()
+            self._gallery_grid.shutdown()
             self.master.open_picker_dialogs.remove(self)
             self.master._check_ephemeral_exit()
         event.accept()
@@ -2897,10 +3330,16 @@ def expand_wildcards(command_line, selected_files):
 # --- main ---
 
 class ImageManager(QMainWindow):
+    files_moved = Signal(object, object)  # submitted paths, list of (old path, new path); from the move worker
+
     def __init__(self, ephemeral_path=None):
         super().__init__()
         self.setWindowTitle("kubux image manager")
         self.ephemeral = ephemeral_path is not None
+        # One worker keeps moves in submission order; network mounts no longer stall the GUI.
+        self.move_pool = ThreadPoolExecutor(max_workers=1)
+        self.moving_files = set()  # sources of submitted moves; kept selected until the move reports back
+        self.files_moved.connect(self._on_files_moved, Qt.QueuedConnection)
         self._load_app_settings()
         font_name, font_size = get_linux_system_ui_font_info()
         self.regrid_job = None
@@ -2976,13 +3415,14 @@ class ImageManager(QMainWindow):
     def _load_app_settings(self):
         try:
             if os.path.exists(APP_SETTINGS_FILE):
-                with open(APP_SETTINGS_FILE, 'r') as f:
-                    self.app_settings = json.load(f)
+                with open(APP_SETTINGS_FILE, 'rb') as f:
+                    self.app_settings = json.loads(f.read())
             else:
                 self.app_settings = {}
         except Exception as e:
             log_error(f"Error loading app settings, initializing defaults: {e}")
             self.app_settings = {}
+        self._saved_settings_data = json.dumps(self.app_settings, indent=4)
 
         self.ui_scale = self.app_settings.get("ui_scale", 1.0)
         self.main_win_geometry = self.app_settings.get("main_win_geometry", None)
@@ -3019,8 +3459,15 @@ class ImageManager(QMainWindow):
             self.app_settings["open_image_info"] = self.collect_open_image_info()
             self.app_settings["list_commands"] = self.list_commands
 
-            with open(APP_SETTINGS_FILE, 'w') as f:
-                json.dump(self.app_settings, f, indent=4)
+            data = json.dumps(self.app_settings, indent=4)  # json.dump writes chunk by chunk
+            if data == self._saved_settings_data and os.path.exists(APP_SETTINGS_FILE):
+                return
+            # Write aside and rename, so a crash mid-write keeps the previous settings.
+            tmp_path = APP_SETTINGS_FILE + ".tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, APP_SETTINGS_FILE)
+            self._saved_settings_data = data
         except Exception as e:
             log_error(f"Error saving app settings: {e}")
 
@@ -3076,33 +3523,44 @@ class ImageManager(QMainWindow):
         main_layout.addWidget(control_frame)
         self.update_button_status()
 
+    def _move_files(self, file_paths, target_dir):
+        """Runs on the move worker."""
+        moved = []
+        for file_path in file_paths:
+            try:
+                new_path = move_file_to_directory(file_path, target_dir)
+            except Exception as e:
+                log_error(f"moving {file_path} to {target_dir} failed, error: {e}")
+                continue
+            if new_path:
+                moved.append((file_path, new_path))
+        self.files_moved.emit(file_paths, moved)
+
+    def _on_files_moved(self, file_paths, moved):
+        self.moving_files.difference_update(file_paths)
+        new_paths = dict(moved)
+        self.selected_files = [(new_paths.get(f, f), d, c) for f, d, c in self.selected_files]
+        self.broadcast_contents_change()  # the regrid re-applies selection state as well
+
+    def _submit_move(self, file_paths, target_dir):
+        self.moving_files.update(file_paths)
+        self.move_pool.submit(self._move_files, file_paths, target_dir)
+
     def move_file_to_directory(self, file_path, target_dir):
-        new_path = move_file_to_directory(file_path, target_dir)
-        if new_path:
-            existing = [(f, d, c) for f, d, c in self.selected_files if f == file_path]
-            if existing:
-                _, picker_dir, picker_cmd = existing[0]
-                self.unselect_file(file_path)
-                self.select_file(new_path, picker_dir, picker_cmd)
-            self.broadcast_contents_change()
+        self._submit_move([file_path], target_dir)
 
     def selected_files_in_directory(self, directory):
-        return [f for f, d, c in self.selected_files if is_file_in_dir(f, directory)]
+        is_in_dir = make_is_file_in_dir(directory)
+        return [f for f, d, c in self.selected_files if is_in_dir(f)]
 
     def move_selected_files_to_directory(self, file_path, target_dir):
-        source_dir = os.path.realpath(os.path.dirname(file_path))
-        old_selected = self.selected_files
-        self.selected_files = []
-        for file, picker_dir, picker_cmd in old_selected:
-            if is_file_in_dir(file, source_dir):
-                new_path = move_file_to_directory(file, target_dir)
-                self.selected_files.append((new_path or file, picker_dir, picker_cmd))
-            else:
-                self.selected_files.append((file, picker_dir, picker_cmd))
-        self.broadcast_contents_change()
+        is_in_source_dir = make_is_file_in_dir(os.path.dirname(file_path))
+        to_move = [f for f, d, c in self.selected_files if is_in_source_dir(f)]
+        self._submit_move(to_move, target_dir)
 
     def sanitize_selected_files(self):
-        self.selected_files = [(f, d, c) for f, d, c in self.selected_files if os.path.exists(f)]
+        self.selected_files = [(f, d, c) for f, d, c in self.selected_files
+                               if f in self.moving_files or os.path.exists(f)]
 
     def execute_command_with_args(self, command, args):
         command = expand_env_vars(command)
@@ -3186,7 +3644,7 @@ class ImageManager(QMainWindow):
             self.regrid_job = None
             for picker in self.open_picker_dialogs:
                 log_debug(f"rigridding picker {picker}")
-                picker._regrid()
+                picker._regrid_when_visible()
             self.update_button_status()
         except Exception as e:
             log_debug(f"something has happened: {e}")
@@ -3298,6 +3756,7 @@ class ImageManager(QMainWindow):
             log_error(f"path {path} has problems, message: {e}")
 
     def closeEvent(self, event):
+        self.move_pool.shutdown(wait=True)  # never abandon a file halfway through a move
         if not self.ephemeral:
             self._save_app_settings()
         for picker in list(self.open_picker_dialogs):